@@ -72,6 +72,7 @@ def build_app():
         "--hidden-import=PySide6.QtWidgets", 
         "--hidden-import=pynput.keyboard",
         "--hidden-import=AppKit",
+        "--hidden-import=ApplicationServices",
         "--clean",
         "--noconfirm",
         "main.py"
@@ -3,24 +3,91 @@ import sys
 import re
 import time
 import logging
+import logging.handlers
 import os
+import subprocess
+from functools import lru_cache
 from datetime import datetime
 
+# Unix timestamp (seconds or milliseconds); decimal timestamps are tried first
+TIMESTAMP_PATTERNS = (
+    re.compile(r'\b\d{10,13}\.\d+\b'),  # timestamp với thập phân
+    re.compile(r'\b\d{10,13}\b'),       # timestamp nguyên
+)
+# Detect mode only looks for a timestamp in the first 4 KB of the clipboard
+DETECT_SCAN_LIMIT = 4096
+
+# Accepted timestamp range in seconds: 2000-01-01 .. 2050-01-01 UTC
+_TS_MIN = 946684800
+_TS_MAX = 2524608000
+
+# Vietnam (UTC+7) has no DST, so VN time is a constant offset from GMT
+_VN_OFFSET = 7 * 3600
+_TIME_FMT = '%Y-%m-%d %H:%M:%S'
+
 # Version expiration check
 VERSION_EXPIRY_TIMESTAMP = 1762497441  # Test timestamp - expires before current time
 from PySide6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout,
-                              QWidget, QLabel, QSystemTrayIcon, QMenu, QToolTip, 
+                              QWidget, QLabel, QSystemTrayIcon, QMenu, QToolTip, QStyle,
                               QCheckBox, QSpinBox, QGroupBox, QPushButton, QMessageBox,
                               QTextEdit, QScrollArea, QSplitter, QFrame, QTabWidget,
                               QListWidget, QListWidgetItem, QDialog)
-from PySide6.QtCore import QTimer, Qt, Signal, QThread, QSettings, QPoint, QDateTime, QUrl
+from PySide6.QtCore import QTimer, Qt, Signal, QObject, QSettings, QPoint, QUrl
 from PySide6.QtGui import QIcon, QPixmap, QFont, QAction, QCursor, QColor, QPalette, QDesktopServices
 from pynput import keyboard
 
+# AppKit/ApplicationServices (pyobjc) are only available on macOS; import them once
+_AppKit = None
+AXIsProcessTrustedWithOptions = None
+_pthread_set_qos_class_self_np = None
+_QOS_CLASS_USER_INTERACTIVE = 0x21
+if sys.platform == "darwin":
+    try:
+        import AppKit as _AppKit
+    except ImportError:
+        pass
+    try:
+        from ApplicationServices import AXIsProcessTrustedWithOptions, kAXTrustedCheckOptionPrompt
+    except ImportError:
+        pass
+    try:
+        import ctypes
+        _pthread_set_qos_class_self_np = ctypes.CDLL("/usr/lib/libSystem.dylib").pthread_set_qos_class_self_np
+    except (OSError, AttributeError):
+        pass
+
+# Dock icon control: Regular shows the dock icon, Prohibited hides it
+if _AppKit is not None:
+    _POLICY_REGULAR = _AppKit.NSApplicationActivationPolicyRegular
+    _POLICY_PROHIBITED = _AppKit.NSApplicationActivationPolicyProhibited
+    
+    def _set_activation_policy(policy):
+        # NSApp only exists once QApplication has created the NSApplication
+        _AppKit.NSApp.setActivationPolicy_(policy)
+else:
+    _set_activation_policy = None
+    _POLICY_REGULAR = _POLICY_PROHIBITED = None
+
+# Process-wide settings store; parsed once and shared by every helper
+_SETTINGS = QSettings("QTKit", "Settings")
+
 # In-memory log storage for UI
 UI_LOGS = []
 MAX_UI_LOGS = 50
 
+# Last formatted log second; bursts of records share one HH:MM:SS string
+_last_log_sec = None
+_last_log_sec_str = ""
+
+def _format_log_time(created):
+    """Format a record timestamp as local HH:MM:SS"""
+    global _last_log_sec, _last_log_sec_str
+    sec = int(created)
+    if sec != _last_log_sec:
+        _last_log_sec = sec
+        _last_log_sec_str = time.strftime("%H:%M:%S", time.localtime(sec))
+    return _last_log_sec_str
+
 class UILogHandler(logging.Handler):
     """Custom log handler for UI display"""
     def emit(self, record):
@@ -47,18 +114,17 @@ def setup_logging():
     # Log file path
     log_file = os.path.join(log_dir, "qtkit.log")
     
-    # Create custom formatter
-    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-    
-    # File handler - only for INFO and ERROR
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    # File handler - only for INFO and ERROR; rotate so the log cannot grow without bound
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=1024 * 1024, backupCount=3, encoding='utf-8')
     file_handler.setLevel(logging.INFO)
-    file_handler.setFormatter(formatter)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
     
-    # UI handler - for all logs
+    # UI handler - for all logs; the viewer renders record.created itself,
+    # so skip the asctime strftime on every record
     ui_handler = UILogHandler()
     ui_handler.setLevel(logging.INFO)
-    ui_handler.setFormatter(formatter)
+    ui_handler.setFormatter(logging.Formatter('%(levelname)s - %(message)s'))
     
     # Setup root logger
     logger = logging.getLogger(__name__)
@@ -76,64 +142,80 @@ def setup_logging():
 # Initialize logger
 logger = setup_logging()
 
-class CmdCMonitor(QThread):
-    """Monitor Cmd+C key combination"""
+def is_accessibility_trusted():
+    """Check the macOS Accessibility permission without starting a listener"""
+    if sys.platform != 'darwin':
+        # Non-macOS systems typically don't need special permissions
+        return True
+    if AXIsProcessTrustedWithOptions is None:
+        # Không kiểm tra được quyền thì coi như chưa được cấp
+        logger.warning("⚠️ ApplicationServices not available, cannot check Accessibility permission")
+        return False
+    return bool(AXIsProcessTrustedWithOptions({kAXTrustedCheckOptionPrompt: False}))
+
+def _decode_unix(timestamp_str, unix_time=None):
+    """Parse a timestamp string into (unix_seconds, original_decimal)
+    unix_time can be passed in when the caller has already parsed the value.
+    """
+    # Extract phần thập phân gốc ("" nếu không có)
+    original_decimal = timestamp_str.partition('.')[2].rstrip('0')  # Loại bỏ trailing zeros
+    
+    if unix_time is None:
+        unix_time = float(timestamp_str)
+        # Nếu số lớn hơn 1e12, coi như milliseconds
+        if unix_time > 1e12:
+            unix_time = unix_time / 1000
+    return unix_time, original_decimal
+
+@lru_cache(maxsize=256)
+def _format_gmt_vn(unix_seconds, original_decimal, show_decimal, show_full_decimal, decimal_places):
+    """Format decoded unix seconds as GMT and VN time strings"""
+    # struct_time from gmtime is much cheaper than building aware datetimes
+    secs = int(unix_seconds)
+    gmt_str = time.strftime(_TIME_FMT, time.gmtime(secs))
+    vn_str = time.strftime(_TIME_FMT, time.gmtime(secs + _VN_OFFSET))
+    
+    # Format output dựa trên settings
+    if show_decimal and original_decimal:
+        if show_full_decimal:
+            # Hiển thị chính xác phần thập phân gốc
+            decimal_part = original_decimal
+        else:
+            # Hiển thị theo số chữ số cấu hình từ phần thập phân gốc
+            decimal_part = original_decimal[:decimal_places]
+        if decimal_part:
+            gmt_str += f".{decimal_part}"
+            vn_str += f".{decimal_part}"
+    
+    return gmt_str, vn_str
+
+class _KeyListener(keyboard.Listener):
+    """pynput listener whose event tap thread runs at user-interactive QoS on macOS"""
+    def run(self):
+        # Keystrokes race the pasteboard write; don't let the tap thread be deprioritised
+        if _pthread_set_qos_class_self_np is not None:
+            _pthread_set_qos_class_self_np(_QOS_CLASS_USER_INTERACTIVE, 0)
+        super().run()
+
+class CmdCMonitor(QObject):
+    """Monitor Cmd+C key combination on pynput's own listener thread"""
     cmd_c_pressed = Signal()
     permission_needed = Signal()
     
     def __init__(self):
         super().__init__()
-        self.running = True
-        self.cmd_pressed = False
         self.listener = None
         self.permission_checked = False
         
     def check_accessibility_permission(self):
         """Check if accessibility permission is granted on macOS"""
-        try:
-            import subprocess
-            import sys
-            
-            if sys.platform == 'darwin':  # macOS
-                # Method 1: Try creating keyboard listener to test permissions
-                try:
-                    test_listener = keyboard.Listener(on_press=lambda key: None)
-                    test_listener.start()
-                    test_listener.stop()
-                    logger.info("✅ Accessibility permissions are granted")
-                    return True
-                except Exception as e:
-                    error_msg = str(e).lower()
-                    if any(word in error_msg for word in ["not trusted", "accessibility", "permission", "denied"]):
-                        logger.warning("⚠️ Accessibility permissions not granted")
-                        return False
-                    else:
-                        # Method 2: Check via system command as fallback
-                        try:
-                            result = subprocess.run([
-                                "osascript", "-e", 
-                                'tell application "System Events" to get application processes'
-                            ], capture_output=True, text=True, timeout=5)
-                            
-                            if result.returncode == 0:
-                                logger.info("✅ System Events accessible - permissions OK")
-                                return True
-                            else:
-                                logger.warning("⚠️ System Events not accessible - permissions needed")
-                                return False
-                        except:
-                            # If all methods fail, assume permissions needed
-                            logger.warning("⚠️ Cannot verify permissions - assuming needed")
-                            return False
-            else:
-                # Non-macOS systems typically don't need special permissions
-                return True
-                
-        except Exception as e:
-            logger.error(f"❌ Error checking accessibility permission: {e}")
-            return False
+        if is_accessibility_trusted():
+            logger.info("✅ Accessibility permissions are granted")
+            return True
+        logger.warning("⚠️ Accessibility permissions not granted")
+        return False
     
-    def run(self):
+    def start(self):
         """Start keyboard listener"""
         try:
             logger.info("🔧 Starting keyboard listener...")
@@ -141,56 +223,35 @@ class CmdCMonitor(QThread):
             # Check permissions first
             if not self.check_accessibility_permission():
                 logger.warning("⚠️ Missing accessibility permissions")
-                self.permission_needed.emit()
-                # Continue running but without actual monitoring
-                while self.running:
-                    self.msleep(1000)
+                # The handler opens a modal alert; run it from the event loop
+                QTimer.singleShot(0, self.permission_needed.emit)
                 return
             
-            self.listener = keyboard.Listener(
-                on_press=self.on_key_press,
-                on_release=self.on_key_release
+            # pynput's Listener is already a thread; signals emitted from it are
+            # queued to the GUI thread. canonical() folds left/right Cmd and letter
+            # case so HotKey sees the same keys it parsed.
+            hotkey = keyboard.HotKey(keyboard.HotKey.parse('<cmd>+c'), self.on_cmd_c)
+            self.listener = _KeyListener(
+                on_press=lambda key: hotkey.press(self.listener.canonical(key)),
+                on_release=lambda key: hotkey.release(self.listener.canonical(key))
             )
             self.listener.start()
             logger.info("🎧 Keyboard listener started")
-            
-            while self.running:
-                self.msleep(100)
                 
         except Exception as e:
             logger.error(f"❌ Keyboard listener error: {e}")
             logger.warning("💡 This usually means accessibility permissions are needed")
             if not self.permission_checked and ("not trusted" in str(e).lower() or "accessibility" in str(e).lower()):
-                self.permission_needed.emit()
+                QTimer.singleShot(0, self.permission_needed.emit)
                 self.permission_checked = True
-            # Try to continue anyway
-            while self.running:
-                self.msleep(1000)
     
-    def on_key_press(self, key):
-        """Handle key press"""
-        try:
-            if key == keyboard.Key.cmd:
-                self.cmd_pressed = True
-            elif (self.cmd_pressed and 
-                  hasattr(key, 'char') and 
-                  key.char and key.char.lower() == 'c'):
-                logger.info("🎯 Cmd+C detected!")
-                self.cmd_c_pressed.emit()
-        except AttributeError:
-            pass
-    
-    def on_key_release(self, key):
-        """Handle key release"""
-        try:
-            if key == keyboard.Key.cmd:
-                self.cmd_pressed = False
-        except AttributeError:
-            pass
+    def on_cmd_c(self):
+        """Handle Cmd+C reported by the hotkey tracker"""
+        logger.debug("🎯 Cmd+C detected!")
+        self.cmd_c_pressed.emit()
     
     def stop(self):
         """Stop monitoring"""
-        self.running = False
         if self.listener:
             self.listener.stop()
 
@@ -285,8 +346,7 @@ class LogViewerWindow(QDialog):
                 color = level_colors.get(log_entry['level'], '#ffffff')
                 
                 # Format timestamp
-                dt = QDateTime.fromSecsSinceEpoch(int(log_entry['timestamp']))
-                time_str = dt.toString("hh:mm:ss")
+                time_str = _format_log_time(log_entry['timestamp'])
                 
                 # Set item text and color
                 item.setText(f"[{time_str}] {log_entry['level']}: {log_entry['message']}")
@@ -433,19 +493,11 @@ class PermissionsWindow(QDialog):
     
     def check_accessibility_permission(self):
         """Check Accessibility permission"""
-        try:
-            test_listener = keyboard.Listener(on_press=lambda key: None)
-            test_listener.start()
-            test_listener.stop()
-            return True
-        except Exception as e:
-            error_msg = str(e).lower()
-            return not any(word in error_msg for word in ["not trusted", "accessibility", "permission", "denied"])
+        return is_accessibility_trusted()
     
     def check_input_monitoring_permission(self):
         """Check Input Monitoring permission"""
         try:
-            import subprocess
             result = subprocess.run([
                 "osascript", "-e", 
                 'tell application "System Events" to get application processes'
@@ -457,7 +509,6 @@ class PermissionsWindow(QDialog):
     def open_permission_settings(self, permission_name):
         """Open system settings for specific permission"""
         try:
-            import subprocess
             
             if permission_name == "Accessibility":
                 commands = [
@@ -487,7 +538,6 @@ class PermissionsWindow(QDialog):
     def open_system_settings(self):
         """Open general system settings"""
         try:
-            import subprocess
             commands = [
                 ["open", "x-apple.systempreferences:com.apple.preference.security?Privacy"],
                 ["open", "/System/Library/PreferencePanes/Security.prefPane"],
@@ -505,13 +555,53 @@ class PermissionsWindow(QDialog):
             logger.error(f"❌ Failed to open system settings: {e}")
 
 class SimpleTimestampViewer(QMainWindow):
+    # Decoded logo shared by the config window, help dialog and tray icon
+    _logo_resolved = False
+    _logo_pixmap = None
+    _logo_scaled = {}  # size -> smoothly scaled copy of _logo_pixmap
+    
     def __init__(self):
         super().__init__()
         self.last_clipboard_text = ""
-        self.settings = QSettings("QTKit", "Settings")
+        self._parse_key = None  # (text, detect_mode) of the last parsed clipboard
+        self._parse_result = ("", None)
+        self._clipboard = QApplication.clipboard()
+        # macOS bumps changeCount on every copy; reading it is far cheaper than the text
+        self._pasteboard = _AppKit.NSPasteboard.generalPasteboard() if _AppKit is not None else None
+        self._change_count = self._pasteboard.changeCount() if self._pasteboard is not None else -1
+        self._last_trigger = 0.0  # monotonic time of the last handled Cmd+C
+        self.settings = _SETTINGS
         self.dock_icon_visible = False  # Track dock icon state
+        
+        # Optional components, created lazily or only once startup succeeds
+        self.log_viewer = None
+        self.permissions_window = None
+        self.expiry_timer = None
+        self.cmd_monitor = None
+        self.tray_icon = None
+        
+        # Coalesce rapid settings changes into a single write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self._do_save_settings)
+        self._dirty = set()  # setting keys changed since the last save
+        
+        # Persistent popup reused for every conversion instead of QToolTip
+        self._popup = self._build_popup()
+        self.tooltip_timer = QTimer(self)
+        self.tooltip_timer.setSingleShot(True)
+        self.tooltip_timer.timeout.connect(self._popup.hide)
+        
+        # After Cmd+C, watch changeCount briefly instead of waiting a fixed 200 ms
+        self._copy_poll = QTimer(self)
+        self._copy_poll.setInterval(20)
+        self._copy_poll.timeout.connect(self._poll_pasteboard)
+        self._copy_poll_deadline = 0.0
+        
         self.load_settings()
-        self.setup_ui()
+        # The config window is built on first show; most sessions stay in the tray
+        self._ui_built = False
+        self.decimal_places_spin = None
         self.setup_tray()
         
         # Hide dock icon for tray-only app
@@ -559,28 +649,99 @@ class SimpleTimestampViewer(QMainWindow):
         self.detect_mode = self.settings.value("detect_mode", False, type=bool)  # Default False
         self.tooltip_duration = self.settings.value("tooltip_duration", 3, type=int)  # Default 3 seconds
         self.first_run = self.settings.value("first_run", True, type=bool)
+        
+        # Snapshot of what is persisted, so writes can skip unchanged values
+        self._cache = {
+            "show_decimal": self.show_decimal,
+            "decimal_places": self.decimal_places,
+            "show_full_decimal": self.show_full_decimal,
+            "detect_mode": self.detect_mode,
+            "tooltip_duration": self.tooltip_duration,
+            "first_run": self.first_run,
+        }
+    
+    def _write(self, key, value):
+        """Write a setting through to QSettings only if it changed"""
+        if self._cache.get(key) == value:
+            return
+        self._cache[key] = value
+        self.settings.setValue(key, value)
+    
+    def save_settings(self, key):
+        """Mark a setting as changed and schedule a debounced save"""
+        self._dirty.add(key)
+        self._save_timer.start(250)
     
-    def save_settings(self):
-        """Save settings to QSettings"""
-        self.settings.setValue("show_decimal", self.show_decimal)
-        self.settings.setValue("decimal_places", self.decimal_places)
-        self.settings.setValue("show_full_decimal", self.show_full_decimal)
-        self.settings.setValue("detect_mode", self.detect_mode)
-        self.settings.setValue("tooltip_duration", self.tooltip_duration)
-        # Don't automatically set first_run to False here
+    def _do_save_settings(self):
+        """Save changed settings to QSettings"""
+        # Keys match the attribute names; first_run is written by its own helpers
+        for key in self._dirty:
+            self._write(key, getattr(self, key))
+        self._dirty.clear()
     
     def mark_first_run_completed(self):
         """Mark first run as completed"""
         self.first_run = False
-        self.settings.setValue("first_run", False)
+        self._write("first_run", False)
+        if self._ui_built:
+            self._apply_mode(False)
     
     def reset_first_run(self):
         """Reset first run for testing - can be called from terminal"""
-        self.settings.setValue("first_run", True)
+        self._write("first_run", True)
         logger.info("🔄 First run reset! Restart app to see welcome screen.")
         
-    def setup_ui(self):
-        """Setup configuration UI"""
+    @staticmethod
+    def _resolve_logo():
+        """Find logo.png and return (path, QPixmap), or (None, None) if missing"""
+        # Try multiple possible paths for logo
+        possible_paths = [
+            "logo.png",
+            os.path.join(os.path.dirname(__file__), "logo.png"),
+            os.path.join(os.path.dirname(sys.executable), "logo.png"),
+            os.path.join(sys._MEIPASS, "logo.png") if hasattr(sys, '_MEIPASS') else None
+        ]
+        
+        for logo_path in possible_paths:
+            if logo_path and os.path.exists(logo_path):
+                pixmap = QPixmap(logo_path)
+                if not pixmap.isNull():
+                    return logo_path, pixmap
+        return None, None
+    
+    @classmethod
+    def _get_logo_pixmap(cls):
+        """Return the decoded logo, resolving it on first use (None if missing)"""
+        if not cls._logo_resolved:
+            cls._logo_resolved = True
+            logo_path, cls._logo_pixmap = cls._resolve_logo()
+            if logo_path:
+                logger.info(f"🎨 Loaded logo from: {logo_path}")
+            else:
+                logger.warning("⚠️ Could not load logo.png, using fallback")
+        return cls._logo_pixmap
+    
+    @classmethod
+    def _get_scaled_logo(cls, size):
+        """Return the logo scaled to fit size x size, cached per size"""
+        scaled = cls._logo_scaled.get(size)
+        if scaled is None:
+            logo_pixmap = cls._get_logo_pixmap()
+            if logo_pixmap is None:
+                return None
+            scaled = logo_pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            cls._logo_scaled[size] = scaled
+        return scaled
+    
+    def setVisible(self, visible):
+        """Build the config UI the first time the window is shown"""
+        if visible and not self._ui_built:
+            self._ui_built = True
+            self._build_static_ui()
+        super().setVisible(visible)
+    
+    def _build_static_ui(self):
+        """Build the configuration UI once; mode-specific parts go through _apply_mode"""
         self.setWindowTitle("QTKit - Cấu hình")
         self.setGeometry(100, 100, 480, 580)
         
@@ -606,6 +767,7 @@ class SimpleTimestampViewer(QMainWindow):
             QCheckBox {
                 padding: 6px;
                 font-size: 16px;
+                color: #495057;
             }
             QCheckBox::indicator {
                 width: 16px;
@@ -624,6 +786,101 @@ class SimpleTimestampViewer(QMainWindow):
                 border-radius: 4px;
                 background-color: white;
             }
+            QLabel#titleLabel {
+                font-size: 16px;
+                font-weight: bold;
+                color: #2c3e50;
+                margin-bottom: 15px;
+            }
+            QLabel#titleLabel[firstRun="true"] {
+                font-size: 18px;
+            }
+            QWidget#detectInfo, QWidget#detectInfo QLabel {
+                background-color: #e9ecef;
+                border-radius: 6px;
+                padding: 8px;
+            }
+            QWidget#detectInfo QLabel {
+                color: #495057;
+                font-size: 16px;
+                margin: 2px 0;
+            }
+            QLabel#decimalLabel {
+                color: #6c757d;
+                font-size: 16px;
+            }
+            QLabel#helperNote {
+                color: #6c757d;
+                font-size: 14px;
+                margin-left: 25px;
+                margin-top: -5px;
+            }
+            QLabel#durationLabel {
+                color: #495057;
+                font-size: 16px;
+            }
+            QLabel#tooltipInfo {
+                color: #6c757d;
+                font-size: 14px;
+                margin-left: 10px;
+            }
+            QWidget#triggerInfo, QWidget#triggerInfo QLabel {
+                background-color: #fff8e1;
+                border-radius: 4px;
+            }
+            QLabel#triggerLabel {
+                color: #f57c00;
+                font-size: 12px;
+                font-weight: bold;
+            }
+            QLabel#warningLabel {
+                color: #f57c00;
+                font-size: 11px;
+            }
+            QWidget#corpInfo, QWidget#corpInfo QLabel {
+                background-color: #e3f2fd;
+                border-radius: 6px;
+            }
+            QLabel#logoLabel {
+                font-size: 40px;
+            }
+            QLabel#corpTitle {
+                color: #1565c0;
+                font-size: 16px;
+                font-weight: bold;
+            }
+            QLabel#corpAuthor {
+                color: #1976d2;
+                font-size: 14px;
+                font-weight: bold;
+            }
+            QLabel#corpCopyright {
+                color: #90a4ae;
+                font-size: 11px;
+            }
+            QLabel#corpContact {
+                color: #1976d2;
+                font-size: 12px;
+                font-weight: bold;
+            }
+            QPushButton#startBtn, QPushButton#hideBtn, QPushButton#quitBtn {
+                color: white;
+                border-radius: 8px;
+                padding: 12px 24px;
+            }
+            QPushButton#startBtn {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+                    stop:0 #28a745, stop:1 #20a83a);
+                font-size: 14px;
+            }
+            QPushButton#hideBtn {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+                    stop:0 #6c757d, stop:1 #5a6268);
+            }
+            QPushButton#quitBtn {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
+                    stop:0 #dc3545, stop:1 #c82333);
+            }
         """)
         
         central_widget = QWidget()
@@ -632,16 +889,11 @@ class SimpleTimestampViewer(QMainWindow):
         layout.setSpacing(15)
         layout.setContentsMargins(20, 20, 20, 20)
         
-        # Title
-        if hasattr(self, 'first_run') and self.first_run:
-            title = QLabel("🎉 Chào mừng đến với QTKit!")
-            title.setStyleSheet("font-size: 18px; font-weight: bold; color: #2c3e50; margin-bottom: 15px;")
-        else:
-            title = QLabel("⚙️ Cấu hình QTKit")
-            title.setStyleSheet("font-size: 16px; font-weight: bold; color: #2c3e50; margin-bottom: 15px;")
-        
-        title.setAlignment(Qt.AlignCenter)
-        layout.addWidget(title)
+        # Title (text depends on first run, see _apply_mode)
+        self.title_label = QLabel()
+        self.title_label.setObjectName("titleLabel")
+        self.title_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.title_label)
             
         # Detection mode group (moved to top)
         detect_group = QGroupBox("🔍 Chế độ detect timestamp")
@@ -651,21 +903,18 @@ class SimpleTimestampViewer(QMainWindow):
         
         self.detect_mode_cb = QCheckBox("Detect timestamp trong clipboard")
         self.detect_mode_cb.setChecked(False)  # Not checked by default
-        self.detect_mode_cb.toggled.connect(self.on_detect_mode_changed)
-        self.detect_mode_cb.setStyleSheet("color: #495057;")
+        self.detect_mode_cb.toggled.connect(lambda v: self._set("detect_mode", v))
         detect_layout.addWidget(self.detect_mode_cb)
         
         # Info container with better styling
         detect_info_container = QWidget()
-        detect_info_container.setStyleSheet("background-color: #e9ecef; border-radius: 6px; padding: 8px;")
+        detect_info_container.setObjectName("detectInfo")
         info_layout = QVBoxLayout(detect_info_container)
         info_layout.setContentsMargins(10, 8, 10, 8)
         
         info_on = QLabel("• Bật: Tự động tìm timestamp trong text dài")
-        info_on.setStyleSheet("color: #495057; font-size: 16px; margin: 2px 0;")
         info_layout.addWidget(info_on)
         info_off = QLabel("• Tắt: Chỉ detect khi toàn bộ clipboard là timestamp")
-        info_off.setStyleSheet("color: #495057; font-size: 16px; margin: 2px 0;")
         info_layout.addWidget(info_off)
         
         detect_layout.addWidget(detect_info_container)
@@ -686,8 +935,7 @@ class SimpleTimestampViewer(QMainWindow):
         # Left side - Show decimal checkbox
         self.show_decimal_cb = QCheckBox("Hiển thị phần thập phân")
         self.show_decimal_cb.setChecked(self.show_decimal)
-        self.show_decimal_cb.toggled.connect(self.on_show_decimal_changed)
-        self.show_decimal_cb.setStyleSheet("color: #495057;")
+        self.show_decimal_cb.toggled.connect(lambda v: self._set("show_decimal", v))
         decimal_main_layout.addWidget(self.show_decimal_cb)
         
         # Right side - Decimal places (aligned with checkbox)
@@ -697,13 +945,13 @@ class SimpleTimestampViewer(QMainWindow):
         decimal_places_layout.setSpacing(8)
         
         decimal_label = QLabel("Số chữ số:")
-        decimal_label.setStyleSheet("color: #6c757d; font-size: 16px;")
+        decimal_label.setObjectName("decimalLabel")
         decimal_places_layout.addWidget(decimal_label)
         
         self.decimal_places_spin = QSpinBox()
         self.decimal_places_spin.setRange(0, 6)
         self.decimal_places_spin.setValue(self.decimal_places)
-        self.decimal_places_spin.valueChanged.connect(self.on_decimal_places_changed)
+        self.decimal_places_spin.valueChanged.connect(lambda v: self._set("decimal_places", v))
         self.decimal_places_spin.setFixedWidth(60)
         decimal_places_layout.addWidget(self.decimal_places_spin)
         decimal_places_layout.addStretch()
@@ -716,13 +964,12 @@ class SimpleTimestampViewer(QMainWindow):
         # Full decimal checkbox
         self.show_full_decimal_cb = QCheckBox("Hiển thị toàn bộ phần thập phân gốc")
         self.show_full_decimal_cb.setChecked(self.show_full_decimal)
-        self.show_full_decimal_cb.toggled.connect(self.on_show_full_decimal_changed)
-        self.show_full_decimal_cb.setStyleSheet("color: #495057;")
+        self.show_full_decimal_cb.toggled.connect(lambda v: self._set("show_full_decimal", v))
         decimal_layout.addWidget(self.show_full_decimal_cb)
         
         # Add helper note
         helper_note = QLabel("(Bỏ qua cài đặt số chữ số bên trên)")
-        helper_note.setStyleSheet("color: #6c757d; font-size: 14px; margin-left: 25px; margin-top: -5px;")
+        helper_note.setObjectName("helperNote")
         decimal_layout.addWidget(helper_note)
         
         layout.addWidget(decimal_group)
@@ -740,13 +987,13 @@ class SimpleTimestampViewer(QMainWindow):
         tooltip_duration_layout.setSpacing(12)
         
         tooltip_duration_label = QLabel("Thời gian hiển thị (giây):")
-        tooltip_duration_label.setStyleSheet("color: #495057; font-size: 16px;")
+        tooltip_duration_label.setObjectName("durationLabel")
         tooltip_duration_layout.addWidget(tooltip_duration_label)
         
         self.tooltip_duration_spin = QSpinBox()
         self.tooltip_duration_spin.setRange(1, 10)
         self.tooltip_duration_spin.setValue(self.tooltip_duration)
-        self.tooltip_duration_spin.valueChanged.connect(self.on_tooltip_duration_changed)
+        self.tooltip_duration_spin.valueChanged.connect(lambda v: self._set("tooltip_duration", v))
         self.tooltip_duration_spin.setFixedWidth(80)
         self.tooltip_duration_spin.setSuffix(" giây")
         tooltip_duration_layout.addWidget(self.tooltip_duration_spin)
@@ -757,7 +1004,7 @@ class SimpleTimestampViewer(QMainWindow):
         
         # Info note
         tooltip_info = QLabel("Tooltip sẽ tự động ẩn sau thời gian này")
-        tooltip_info.setStyleSheet("color: #6c757d; font-size: 14px; margin-left: 10px;")
+        tooltip_info.setObjectName("tooltipInfo")
         tooltip_layout.addWidget(tooltip_info)
         
         layout.addWidget(tooltip_group)
@@ -767,68 +1014,38 @@ class SimpleTimestampViewer(QMainWindow):
         
         # Trigger and warning info - minimal style
         trigger_container = QWidget()
-        trigger_container.setStyleSheet("""
-            background-color: #fff8e1;
-            border-radius: 4px;
-        """)
+        trigger_container.setObjectName("triggerInfo")
         trigger_layout = QVBoxLayout(trigger_container)
         trigger_layout.setContentsMargins(8, 6, 8, 6)
         trigger_layout.setSpacing(2)
         
         info_trigger = QLabel("⌨️ Sử dụng: Command + C")
-        info_trigger.setStyleSheet("color: #f57c00; font-size: 12px; font-weight: bold;")
+        info_trigger.setObjectName("triggerLabel")
         trigger_layout.addWidget(info_trigger)
         
         info_warning = QLabel("⚠️ Nguyên lý: Theo dõi Cmd+C và kiểm tra clipboard")
-        info_warning.setStyleSheet("color: #f57c00; font-size: 11px;")
+        info_warning.setObjectName("warningLabel")
         trigger_layout.addWidget(info_warning)
         
         layout.addWidget(trigger_container)
         
         # QT Corporation info section with logo
         qt_corp_container = QWidget()
-        qt_corp_container.setStyleSheet("""
-            background-color: #e3f2fd;
-            border-radius: 6px;
-        """)
+        qt_corp_container.setObjectName("corpInfo")
         qt_corp_main_layout = QHBoxLayout(qt_corp_container)
         qt_corp_main_layout.setContentsMargins(12, 8, 12, 8)
         qt_corp_main_layout.setSpacing(12)
         
         # Logo on the left - bigger size with proper path handling
         logo_label = QLabel()
-        try:
-            import os
-            # Try multiple possible paths for logo
-            possible_paths = [
-                "logo.png",
-                os.path.join(os.path.dirname(__file__), "logo.png"),
-                os.path.join(os.path.dirname(sys.executable), "logo.png"),
-                os.path.join(sys._MEIPASS, "logo.png") if hasattr(sys, '_MEIPASS') else None
-            ]
-            
-            logo_loaded = False
-            for logo_path in possible_paths:
-                if logo_path and os.path.exists(logo_path):
-                    logger.info(f"🎨 Loading UI logo from: {logo_path}")
-                    logo_pixmap = QPixmap(logo_path)
-                    if not logo_pixmap.isNull():
-                        # Scale logo to bigger size (64x64)
-                        scaled_logo = logo_pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                        logo_label.setPixmap(scaled_logo)
-                        logo_loaded = True
-                        break
-            
-            if not logo_loaded:
-                logger.warning("⚠️ Could not load logo.png for UI, using fallback")
-                # Fallback text if logo not found
-                logo_label.setText("📱")
-                logo_label.setStyleSheet("font-size: 40px;")
-        except Exception as e:
-            logger.error(f"❌ Error loading UI logo: {e}")
-            # Fallback text if error
+        logo_label.setObjectName("logoLabel")
+        # Bigger logo size (64x64)
+        scaled_logo = self._get_scaled_logo(64)
+        if scaled_logo is not None:
+            logo_label.setPixmap(scaled_logo)
+        else:
+            # Fallback text if logo not found
             logo_label.setText("📱")
-            logo_label.setStyleSheet("font-size: 40px;")
         
         logo_label.setAlignment(Qt.AlignCenter)
         logo_label.setFixedSize(64, 64)
@@ -839,19 +1056,19 @@ class SimpleTimestampViewer(QMainWindow):
         text_layout.setSpacing(2)
         
         corp_title = QLabel("QTKit - QuickTime Kit")
-        corp_title.setStyleSheet("color: #1565c0; font-size: 16px; font-weight: bold;")
+        corp_title.setObjectName("corpTitle")
         text_layout.addWidget(corp_title)
         
         corp_author = QLabel("by Quang Trần - QT Corporation")
-        corp_author.setStyleSheet("color: #1976d2; font-size: 14px; font-weight: bold;")
+        corp_author.setObjectName("corpAuthor")
         text_layout.addWidget(corp_author)
         
         corp_copyright = QLabel("Copyright © 2025 QT Corporation")
-        corp_copyright.setStyleSheet("color: #90a4ae; font-size: 11px;")
+        corp_copyright.setObjectName("corpCopyright")
         text_layout.addWidget(corp_copyright)
         
         corp_contact = QLabel('📞 Contact: <a href="https://t.me/qpepsi769" style="color: #1976d2; text-decoration: underline;">@qpepsi769</a>')
-        corp_contact.setStyleSheet("color: #1976d2; font-size: 12px; font-weight: bold;")
+        corp_contact.setObjectName("corpContact")
         corp_contact.setOpenExternalLinks(True)
         text_layout.addWidget(corp_contact)
         
@@ -867,61 +1084,54 @@ class SimpleTimestampViewer(QMainWindow):
         button_layout = QHBoxLayout()
         button_layout.setSpacing(12)
         
-        if hasattr(self, 'first_run') and self.first_run:
-            start_btn = QPushButton("🚀 Bắt đầu & chạy ngầm")
-            start_btn.clicked.connect(self.start_using)
-            start_btn.setStyleSheet("""
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #28a745, stop:1 #20a83a);
-                color: white;
-                border-radius: 8px;
-                padding: 12px 24px;
-                font-size: 14px;
-            """)
-            start_btn.setMinimumHeight(45)
-            button_layout.addWidget(start_btn)
-        else:
-            hide_btn = QPushButton("Ẩn cửa sổ")
-            hide_btn.clicked.connect(self.hide_config)
-            hide_btn.setStyleSheet("""
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                    stop:0 #6c757d, stop:1 #5a6268);
-                color: white;
-                border-radius: 8px;
-                padding: 12px 24px;
-            """)
-            hide_btn.setMinimumHeight(45)
-            button_layout.addWidget(hide_btn)
+        # Both buttons are built up front; _apply_mode shows one of them
+        self.start_btn = QPushButton("🚀 Bắt đầu & chạy ngầm")
+        self.start_btn.clicked.connect(self.start_using)
+        self.start_btn.setObjectName("startBtn")
+        self.start_btn.setMinimumHeight(45)
+        button_layout.addWidget(self.start_btn)
+        
+        self.hide_btn = QPushButton("Ẩn cửa sổ")
+        self.hide_btn.clicked.connect(self.hide_config)
+        self.hide_btn.setObjectName("hideBtn")
+        self.hide_btn.setMinimumHeight(45)
+        button_layout.addWidget(self.hide_btn)
         
         quit_btn = QPushButton("Thoát ứng dụng")
         quit_btn.clicked.connect(self.quit_app)
-        quit_btn.setStyleSheet("""
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1, 
-                stop:0 #dc3545, stop:1 #c82333);
-            color: white;
-            border-radius: 8px;
-            padding: 12px 24px;
-        """)
+        quit_btn.setObjectName("quitBtn")
         quit_btn.setMinimumHeight(45)
         button_layout.addWidget(quit_btn)
         
         layout.addLayout(button_layout)
         
         # Update UI state
+        self._apply_mode(self.first_run)
         self.update_decimal_ui_state()
     
+    def _apply_mode(self, first_run):
+        """Switch the title and buttons between first-run welcome and normal config"""
+        if first_run:
+            self.title_label.setText("🎉 Chào mừng đến với QTKit!")
+        else:
+            self.title_label.setText("⚙️ Cấu hình QTKit")
+        
+        # Title size comes from the QLabel#titleLabel[firstRun] rule; re-polish to apply it
+        self.title_label.setProperty("firstRun", first_run)
+        self.title_label.style().unpolish(self.title_label)
+        self.title_label.style().polish(self.title_label)
+        
+        self.start_btn.setVisible(first_run)
+        self.hide_btn.setVisible(not first_run)
+    
     def show_first_run_welcome(self):
         """Show welcome popup for first run"""
         logger.info("📱 Setting up first run welcome...")
         
         # Make sure dock icon is visible for first run on macOS
-        if sys.platform == "darwin":
-            try:
-                import AppKit
-                logger.info("🍎 Setting macOS app policy to Regular...")
-                AppKit.NSApp.setActivationPolicy_(AppKit.NSApplicationActivationPolicyRegular)
-            except ImportError:
-                logger.warning("⚠️ AppKit not available")
+        if _set_activation_policy is not None:
+            logger.info("🍎 Setting macOS app policy to Regular...")
+            _set_activation_policy(_POLICY_REGULAR)
         
         # Show the main config window with delay to ensure it appears
         logger.info("🪟 Showing window...")
@@ -942,25 +1152,17 @@ class SimpleTimestampViewer(QMainWindow):
         self.hide()
         
         # Hide dock icon on macOS after first setup
-        if sys.platform == "darwin":
-            try:
-                import AppKit
-                AppKit.NSApp.setActivationPolicy_(AppKit.NSApplicationActivationPolicyProhibited)
-            except ImportError:
-                pass
+        if _set_activation_policy is not None:
+            _set_activation_policy(_POLICY_PROHIBITED)
         
         logger.info("✅ Configuration saved! App is now running in background.")
     
     def show_config(self):
         """Show config window from tray menu"""
         # Temporarily show dock icon on macOS to display window
-        if sys.platform == "darwin":
-            try:
-                import AppKit
-                AppKit.NSApp.setActivationPolicy_(AppKit.NSApplicationActivationPolicyRegular)
-                self.dock_icon_visible = True
-            except ImportError:
-                pass
+        if _set_activation_policy is not None:
+            _set_activation_policy(_POLICY_REGULAR)
+            self.dock_icon_visible = True
         
         self.show()
         self.raise_()
@@ -971,20 +1173,16 @@ class SimpleTimestampViewer(QMainWindow):
         self.hide()
         
         # Only hide dock icon if no other dialogs are open
-        if sys.platform == "darwin" and self.dock_icon_visible:
+        if _set_activation_policy is not None and self.dock_icon_visible:
             # Check if any dialogs are still open
             has_open_dialogs = (
-                (hasattr(self, 'log_viewer') and self.log_viewer and self.log_viewer.isVisible()) or
-                (hasattr(self, 'permissions_window') and self.permissions_window and self.permissions_window.isVisible())
+                (self.log_viewer is not None and self.log_viewer.isVisible()) or
+                (self.permissions_window is not None and self.permissions_window.isVisible())
             )
             
             if not has_open_dialogs:
-                try:
-                    import AppKit
-                    AppKit.NSApp.setActivationPolicy_(AppKit.NSApplicationActivationPolicyProhibited)
-                    self.dock_icon_visible = False
-                except ImportError:
-                    pass
+                _set_activation_policy(_POLICY_PROHIBITED)
+                self.dock_icon_visible = False
     
     def show_help(self):
         """Show help dialog"""
@@ -1005,22 +1203,10 @@ class SimpleTimestampViewer(QMainWindow):
         
         # Logo
         logo_label = QLabel()
-        try:
-            import os
-            possible_paths = [
-                "logo.png",
-                os.path.join(os.path.dirname(__file__), "logo.png"),
-                os.path.join(sys._MEIPASS, "logo.png") if hasattr(sys, '_MEIPASS') else None
-            ]
-            
-            for logo_path in possible_paths:
-                if logo_path and os.path.exists(logo_path):
-                    logo_pixmap = QPixmap(logo_path)
-                    if not logo_pixmap.isNull():
-                        scaled_logo = logo_pixmap.scaled(80, 80, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                        logo_label.setPixmap(scaled_logo)
-                        break
-        except:
+        scaled_logo = self._get_scaled_logo(80)
+        if scaled_logo is not None:
+            logo_label.setPixmap(scaled_logo)
+        else:
             logo_label.setText("📱")
             logo_label.setStyleSheet("font-size: 60px;")
         
@@ -1179,18 +1365,14 @@ class SimpleTimestampViewer(QMainWindow):
         def close_help_dialog():
             dialog.close()
             # Auto-hide dock icon if config window is also hidden
-            if sys.platform == "darwin" and not self.isVisible():
+            if _set_activation_policy is not None and not self.isVisible():
                 has_other_dialogs = (
-                    (hasattr(self, 'log_viewer') and self.log_viewer and self.log_viewer.isVisible()) or
-                    (hasattr(self, 'permissions_window') and self.permissions_window and self.permissions_window.isVisible())
+                    (self.log_viewer is not None and self.log_viewer.isVisible()) or
+                    (self.permissions_window is not None and self.permissions_window.isVisible())
                 )
                 if not has_other_dialogs:
-                    try:
-                        import AppKit
-                        AppKit.NSApp.setActivationPolicy_(AppKit.NSApplicationActivationPolicyProhibited)
-                        self.dock_icon_visible = False
-                    except ImportError:
-                        pass
+                    _set_activation_policy(_POLICY_PROHIBITED)
+                    self.dock_icon_visible = False
         
         close_btn.clicked.connect(close_help_dialog)
         close_btn.setStyleSheet("""
@@ -1214,24 +1396,16 @@ class SimpleTimestampViewer(QMainWindow):
         layout.addLayout(button_layout)
         
         # Show with existing dock icon policy (don't change it)
-        if sys.platform == "darwin" and not self.dock_icon_visible:
-            try:
-                import AppKit
-                AppKit.NSApp.setActivationPolicy_(AppKit.NSApplicationActivationPolicyRegular)
-                self.dock_icon_visible = True
-            except ImportError:
-                pass
+        if _set_activation_policy is not None and not self.dock_icon_visible:
+            _set_activation_policy(_POLICY_REGULAR)
+            self.dock_icon_visible = True
         
         dialog.exec_()
         
         # Only hide dock icon if config window is not visible
-        if sys.platform == "darwin" and not self.isVisible():
-            try:
-                import AppKit
-                AppKit.NSApp.setActivationPolicy_(AppKit.NSApplicationActivationPolicyProhibited)
-                self.dock_icon_visible = False
-            except ImportError:
-                pass
+        if _set_activation_policy is not None and not self.isVisible():
+            _set_activation_policy(_POLICY_PROHIBITED)
+            self.dock_icon_visible = False
         
     def setup_tray(self):
         """Setup system tray"""
@@ -1240,45 +1414,34 @@ class SimpleTimestampViewer(QMainWindow):
             
         self.tray_icon = QSystemTrayIcon(self)
         
-        # Use logo.png as icon with proper path handling
-        try:
-            import os
-            # Try multiple possible paths
-            possible_paths = [
-                "logo.png",
-                os.path.join(os.path.dirname(__file__), "logo.png"),
-                os.path.join(os.path.dirname(sys.executable), "logo.png"),
-                os.path.join(sys._MEIPASS, "logo.png") if hasattr(sys, '_MEIPASS') else None
-            ]
-            
-            icon_loaded = False
-            for icon_path in possible_paths:
-                if icon_path and os.path.exists(icon_path):
-                    logger.info(f"🎨 Loading tray icon from: {icon_path}")
-                    pixmap = QPixmap(icon_path)
-                    if not pixmap.isNull():
-                        # Scale to appropriate tray icon size
-                        scaled_pixmap = pixmap.scaled(32, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                        self.tray_icon.setIcon(QIcon(scaled_pixmap))
-                        icon_loaded = True
-                        break
-            
-            if not icon_loaded:
-                logger.warning("⚠️ Could not load logo.png, using fallback icon")
-                # Fallback to simple icon
-                pixmap = QPixmap(32, 32)
-                pixmap.fill(Qt.blue)
-                self.tray_icon.setIcon(QIcon(pixmap))
-                
-        except Exception as e:
-            logger.error(f"❌ Error loading tray icon: {e}")
-            # Fallback to simple icon
-            pixmap = QPixmap(32, 32)
-            pixmap.fill(Qt.blue)
-            self.tray_icon.setIcon(QIcon(pixmap))
+        # Use logo.png as icon
+        # Appropriate tray icon size
+        scaled_pixmap = self._get_scaled_logo(32)
+        if scaled_pixmap is not None:
+            self.tray_icon.setIcon(QIcon(scaled_pixmap))
+        else:
+            # Fallback to a theme/style icon Qt already has loaded
+            self.tray_icon.setIcon(QIcon.fromTheme(
+                "appointment-soon", self.style().standardIcon(QStyle.SP_ComputerIcon)))
+        
+        # Tray menu; actions are added the first time it is about to show
+        self._tray_menu = QMenu()
+        self._tray_menu_built = False
+        self._tray_menu.aboutToShow.connect(self._populate_tray_menu)
+        if sys.platform == "darwin":
+            # macOS does not open an empty status-item menu, so fill it right after startup
+            QTimer.singleShot(0, self._populate_tray_menu)
         
-        # Tray menu
-        tray_menu = QMenu()
+        self.tray_icon.setContextMenu(self._tray_menu)
+        self.tray_icon.show()
+        self.tray_icon.setToolTip("QTKit - QuickTime Kit\n🎯 Nhấn Cmd+C trên timestamp để xem thời gian\n⚙️ Right-click để cấu hình")
+    
+    def _populate_tray_menu(self):
+        """Add the tray menu actions on first use"""
+        if self._tray_menu_built:
+            return
+        self._tray_menu_built = True
+        tray_menu = self._tray_menu
         
         # Main actions
         config_action = QAction("⚙️ Mở cấu hình", self)
@@ -1316,10 +1479,6 @@ class SimpleTimestampViewer(QMainWindow):
         quit_action = QAction("🚪 Thoát QTKit", self)
         quit_action.triggered.connect(self.quit_app)
         tray_menu.addAction(quit_action)
-        
-        self.tray_icon.setContextMenu(tray_menu)
-        self.tray_icon.show()
-        self.tray_icon.setToolTip("QTKit - QuickTime Kit\n🎯 Nhấn Cmd+C trên timestamp để xem thời gian\n⚙️ Right-click để cấu hình")
     
     def force_request_permissions(self):
         """Force request both Accessibility and Input Monitoring permissions on every startup"""
@@ -1331,20 +1490,14 @@ class SimpleTimestampViewer(QMainWindow):
         permissions_needed = []
         
         # Test Accessibility permission
-        try:
-            test_listener = keyboard.Listener(on_press=lambda key: None)
-            test_listener.start()
-            test_listener.stop()
+        if is_accessibility_trusted():
             logger.info("✅ Accessibility permission already granted")
-        except Exception as e:
-            error_msg = str(e).lower()
-            if any(word in error_msg for word in ["not trusted", "accessibility", "permission", "denied"]):
-                logger.warning("⚠️ Accessibility permission needed")
-                permissions_needed.append("Accessibility")
+        else:
+            logger.warning("⚠️ Accessibility permission needed")
+            permissions_needed.append("Accessibility")
         
         # Test Input Monitoring permission via AppleScript
         try:
-            import subprocess
             subprocess.run([
                 "osascript", "-e", 
                 'tell application "System Events" to get application processes'
@@ -1367,12 +1520,8 @@ class SimpleTimestampViewer(QMainWindow):
         logger.warning(f"🔐 Permissions needed: {', '.join(permissions_needed)}")
         
         # Show dock icon temporarily for the alert
-        if sys.platform == "darwin":
-            try:
-                import AppKit
-                AppKit.NSApp.setActivationPolicy_(AppKit.NSApplicationActivationPolicyRegular)
-            except ImportError:
-                pass
+        if _set_activation_policy is not None:
+            _set_activation_policy(_POLICY_REGULAR)
         
         msg = QMessageBox()
         msg.setWindowTitle("QTKit - Cần cấp quyền bắt buộc")
@@ -1424,12 +1573,8 @@ System Preferences → Security & Privacy → Privacy → Accessibility"""
         result = msg.exec_()
         
         # Hide dock icon again after alert
-        if sys.platform == "darwin":
-            try:
-                import AppKit
-                AppKit.NSApp.setActivationPolicy_(AppKit.NSApplicationActivationPolicyProhibited)
-            except ImportError:
-                pass
+        if _set_activation_policy is not None:
+            _set_activation_policy(_POLICY_PROHIBITED)
         
         if msg.clickedButton() == open_prefs_btn:
             self.open_system_preferences()
@@ -1445,7 +1590,6 @@ System Preferences → Security & Privacy → Privacy → Accessibility"""
     def open_system_preferences(self):
         """Open macOS System Preferences to relevant permission sections"""
         try:
-            import subprocess
             # Try multiple ways to open preferences for different macOS versions
             commands = [
                 # macOS 13+ (Ventura+)
@@ -1492,18 +1636,21 @@ System Preferences → Security & Privacy → Privacy → Accessibility"""
     def setup_cmd_c_monitoring(self):
         """Setup Cmd+C key monitoring"""
         try:
+            # Qt on macOS only re-reads the pasteboard when QTKit itself becomes
+            # active, so dataChanged never fires for copies made in other apps.
+            # Elsewhere Qt reports every copy, so no keyboard hook is needed.
+            if sys.platform != "darwin":
+                logger.info("🎯 Setting up clipboard change monitoring...")
+                self._clipboard.dataChanged.connect(self.on_clipboard_changed)
+                logger.info("✅ Clipboard monitoring started successfully!")
+                return
+            
             logger.info("🎯 Setting up Cmd+C monitoring...")
             self.cmd_monitor = CmdCMonitor()
             self.cmd_monitor.cmd_c_pressed.connect(self.on_cmd_c_detected)
             self.cmd_monitor.permission_needed.connect(self.show_permission_alert)
             self.cmd_monitor.start()
             
-            # Setup tooltip font with system default font
-            font = QApplication.font()
-            font.setPointSize(13)
-            font.setBold(True)
-            QToolTip.setFont(font)
-            
             logger.info("✅ Cmd+C monitoring started successfully!")
             logger.info("📝 Note: You may need to grant Accessibility permissions in System Preferences > Security & Privacy > Privacy > Accessibility")
             
@@ -1516,12 +1663,8 @@ System Preferences → Security & Privacy → Privacy → Accessibility"""
         logger.warning("🔐 Accessibility permissions required")
         
         # Show dock icon temporarily for the alert
-        if sys.platform == "darwin":
-            try:
-                import AppKit
-                AppKit.NSApp.setActivationPolicy_(AppKit.NSApplicationActivationPolicyRegular)
-            except ImportError:
-                pass
+        if _set_activation_policy is not None:
+            _set_activation_policy(_POLICY_REGULAR)
         
         msg = QMessageBox()
         msg.setWindowTitle("QTKit - Cần cấp quyền")
@@ -1556,16 +1699,11 @@ System Settings → Privacy & Security → Accessibility"""
         result = msg.exec_()
         
         # Hide dock icon again after alert
-        if sys.platform == "darwin":
-            try:
-                import AppKit
-                AppKit.NSApp.setActivationPolicy_(AppKit.NSApplicationActivationPolicyProhibited)
-            except ImportError:
-                pass
+        if _set_activation_policy is not None:
+            _set_activation_policy(_POLICY_PROHIBITED)
         
         if msg.clickedButton() == open_prefs_btn:
             try:
-                import subprocess
                 # Try multiple ways to open preferences
                 commands = [
                     ["open", "x-apple.systempreferences:com.apple.preference.security?Privacy_Accessibility"],
@@ -1586,25 +1724,26 @@ System Settings → Privacy & Security → Accessibility"""
                 
         elif msg.clickedButton() == retry_btn:
             # Retry permission check
-            if self.check_accessibility_permission():
+            if is_accessibility_trusted():
                 logger.info("✅ Permissions granted! Restarting keyboard monitoring...")
-                if hasattr(self, 'cmd_monitor'):
+                if self.cmd_monitor is not None:
                     self.cmd_monitor.stop()
                 self.setup_cmd_c_monitoring()
             else:
                 logger.warning("⚠️ Permissions still not granted")
     
-    def on_show_decimal_changed(self, checked):
-        """Handle show decimal checkbox change"""
-        self.show_decimal = checked
+    def _set(self, key, value):
+        """Apply a setting changed from the config window and schedule its save"""
+        setattr(self, key, value)
         self.update_decimal_ui_state()
-        self.save_settings()
+        self.save_settings(key)
+        logger.debug("⚙️ Setting %s changed to %s", key, value)
         
     def show_logs(self):
         """Show logs window"""
         try:
             # Lazy loading for better performance
-            if not hasattr(self, 'log_viewer') or self.log_viewer is None:
+            if self.log_viewer is None:
                 self.log_viewer = LogViewerWindow()
                 # Set window flags only once during creation
                 self.log_viewer.setWindowFlags(
@@ -1612,13 +1751,9 @@ System Settings → Privacy & Security → Accessibility"""
                 )
             
             # Ensure dock icon is visible if needed
-            if sys.platform == 'darwin' and not self.dock_icon_visible:
-                try:
-                    import AppKit
-                    AppKit.NSApp.setActivationPolicy_(AppKit.NSApplicationActivationPolicyRegular)
-                    self.dock_icon_visible = True
-                except ImportError:
-                    pass
+            if _set_activation_policy is not None and not self.dock_icon_visible:
+                _set_activation_policy(_POLICY_REGULAR)
+                self.dock_icon_visible = True
             
             self.log_viewer.show()
             self.log_viewer.activateWindow()
@@ -1631,7 +1766,7 @@ System Settings → Privacy & Security → Accessibility"""
         """Show permissions window"""
         try:
             # Lazy loading for better performance
-            if not hasattr(self, 'permissions_window') or self.permissions_window is None:
+            if self.permissions_window is None:
                 self.permissions_window = PermissionsWindow()
                 # Set window flags only once during creation
                 self.permissions_window.setWindowFlags(
@@ -1639,13 +1774,9 @@ System Settings → Privacy & Security → Accessibility"""
                 )
             
             # Ensure dock icon is visible if needed
-            if sys.platform == 'darwin' and not self.dock_icon_visible:
-                try:
-                    import AppKit
-                    AppKit.NSApp.setActivationPolicy_(AppKit.NSApplicationActivationPolicyRegular)
-                    self.dock_icon_visible = True
-                except ImportError:
-                    pass
+            if _set_activation_policy is not None and not self.dock_icon_visible:
+                _set_activation_policy(_POLICY_REGULAR)
+                self.dock_icon_visible = True
             
             self.permissions_window.show()
             self.permissions_window.activateWindow()
@@ -1666,12 +1797,8 @@ System Settings → Privacy & Security → Accessibility"""
         logger.warning("🚫 Version expired!")
         
         # Show dock icon temporarily for the alert
-        if sys.platform == "darwin":
-            try:
-                import AppKit
-                AppKit.NSApp.setActivationPolicy_(AppKit.NSApplicationActivationPolicyRegular)
-            except ImportError:
-                pass
+        if _set_activation_policy is not None:
+            _set_activation_policy(_POLICY_REGULAR)
         
         msg = QMessageBox()
         msg.setWindowTitle("QTKit - Phiên bản hết hạn")
@@ -1697,12 +1824,8 @@ THÔNG TIN:
         result = msg.exec_()
         
         # Hide dock icon again after alert
-        if sys.platform == "darwin":
-            try:
-                import AppKit
-                AppKit.NSApp.setActivationPolicy_(AppKit.NSApplicationActivationPolicyProhibited)
-            except ImportError:
-                pass
+        if _set_activation_policy is not None:
+            _set_activation_policy(_POLICY_PROHIBITED)
         
         # Exit application after showing dialog
         QApplication.quit()
@@ -1713,57 +1836,81 @@ THÔNG TIN:
             if self.check_version_expiry():
                 logger.warning("🚫 Version expired during runtime!")
                 # Stop the timer to prevent multiple dialogs
-                if hasattr(self, 'expiry_timer'):
+                if self.expiry_timer is not None:
                     self.expiry_timer.stop()
                 # Show expiry dialog and exit
                 self.show_version_expired_dialog()
         except Exception as e:
             logger.error(f"Error in periodic expiry check: {e}")
     
-    def on_decimal_places_changed(self, value):
-        """Handle decimal places change"""
-        self.decimal_places = value
-        self.save_settings()
-    
-    def on_show_full_decimal_changed(self, checked):
-        """Handle show full decimal checkbox change"""
-        self.show_full_decimal = checked
-        self.update_decimal_ui_state()
-        self.save_settings()
-    
-    def on_detect_mode_changed(self, checked):
-        """Handle detect mode checkbox change"""
-        self.detect_mode = checked
-        self.save_settings()
-    
-    def on_tooltip_duration_changed(self, value):
-        """Handle tooltip duration change"""
-        self.tooltip_duration = value
-        self.save_settings()
-        logger.info(f"🕐 Tooltip duration changed to {value} seconds")
-    
     def update_decimal_ui_state(self):
         """Update decimal UI elements state"""
-        if hasattr(self, 'decimal_places_spin'):
+        if self.decimal_places_spin is not None:
             # Disable decimal places when show_decimal is off or show_full_decimal is on
             self.decimal_places_spin.setEnabled(self.show_decimal and not self.show_full_decimal)
         
     def on_cmd_c_detected(self):
         """Handle Cmd+C detection"""
-        # Wait a moment for clipboard to update
-        QTimer.singleShot(200, self.check_clipboard_for_timestamp)
+        # Ignore repeated taps so only one clipboard check is queued
+        now = time.monotonic()
+        if now - self._last_trigger < 0.25:
+            return
+        self._last_trigger = now
         
-    def check_clipboard_for_timestamp(self):
+        if self._pasteboard is None:
+            # Wait a moment for clipboard to update
+            QTimer.singleShot(200, self.check_clipboard_for_timestamp)
+            return
+        
+        self._copy_poll_deadline = now + 1.0
+        self._copy_poll.start()
+    
+    def _poll_pasteboard(self):
+        """Check the clipboard as soon as the copy lands on the pasteboard"""
+        if self._pasteboard.changeCount() != self._change_count:
+            self._copy_poll.stop()
+            self.check_clipboard_for_timestamp()
+        elif time.monotonic() > self._copy_poll_deadline:
+            # Nothing was copied (e.g. Cmd+C without a selection)
+            self._copy_poll.stop()
+        
+    def on_clipboard_changed(self):
+        """Handle clipboard change notifications from Qt"""
+        # Some apps set the clipboard several times per copy
+        self.check_clipboard_for_timestamp(skip_unchanged=True)
+    
+    def check_clipboard_for_timestamp(self, skip_unchanged=False):
         """Check clipboard specifically for timestamp after Cmd+C"""
         try:
-            clipboard = QApplication.clipboard()
-            current_text = clipboard.text().strip()
+            # A Cmd+C that copied nothing leaves the pasteboard untouched
+            if self._pasteboard is not None:
+                change_count = self._pasteboard.changeCount()
+                if change_count == self._change_count:
+                    return
+                self._change_count = change_count
+            
+            clipboard = self._clipboard
+            
+            # Skip images/files/rich content without converting it to text
+            mime_data = clipboard.mimeData()
+            if mime_data is None or not mime_data.hasText():
+                return
+            # Bound the work on huge pastes (e.g. whole log files)
+            current_text = mime_data.text()[:65536].strip()
+            
+            if skip_unchanged and current_text == self.last_clipboard_text:
+                return
+            self.last_clipboard_text = current_text
+            
+            # A bare timestamp is at most 20 chars; only detect mode scans long text
+            if not self.detect_mode and len(current_text) > 32:
+                return
             
             if current_text:
-                timestamp_str, is_valid = self.get_timestamp(current_text)
-                if is_valid:
-                    logger.info(f"✅ Timestamp detected: {timestamp_str}")
-                    self.show_tooltip(timestamp_str)
+                timestamp_str, unix_time = self._parse_cached(current_text)
+                if unix_time is not None:
+                    logger.info("✅ Timestamp detected: %s", timestamp_str)
+                    self.show_tooltip(timestamp_str, unix_time)
                 # Don't log non-timestamp content to reduce spam
             else:
                 logger.warning("📋 Clipboard is empty")
@@ -1772,138 +1919,133 @@ THÔNG TIN:
             logger.error(f"❌ Error checking clipboard: {e}")
         
 
+    def _parse_cached(self, text):
+        """get_timestamp with a one-entry cache so re-copies skip parsing"""
+        key = (text, self.detect_mode)
+        if key != self._parse_key:
+            self._parse_result = self.get_timestamp(text)
+            self._parse_key = key
+        return self._parse_result
+    
     def get_timestamp(self, text):
-        """Extract timestamp from text and check if valid
-        Returns: (timestamp_string, is_valid_timestamp)
+        """Extract timestamp from text and parse it
+        Returns: (timestamp_string, unix_seconds), unix_seconds is None if not a timestamp
+        text is expected to be stripped already (see check_clipboard_for_timestamp).
         """
-        text = text.strip()
-        
         # Chế độ detect: tìm timestamp trong text
-        if hasattr(self, 'detect_mode') and self.detect_mode:
-            # Tìm các số có độ dài 10-20 ký tự trong text
-            import re
-            patterns = [
-                r'\b\d{10,13}\.\d+\b',  # timestamp với thập phân
-                r'\b\d{10,13}\b',       # timestamp nguyên
-            ]
+        if self.detect_mode:
+            # Tìm số đầu tiên có dạng timestamp trong text (chỉ 4 KB đầu)
+            for pattern in TIMESTAMP_PATTERNS:
+                match = pattern.search(text, 0, DETECT_SCAN_LIMIT)
+                if match:
+                    candidate = match.group(0)
+                    unix_time = self._parse_timestamp(candidate)
+                    if unix_time is not None:
+                        return candidate, unix_time
             
-            for pattern in patterns:
-                matches = re.findall(pattern, text)
-                if matches:
-                    candidate = matches[0]
-                    if self._is_valid_timestamp(candidate):
-                        return candidate, True
-            
-            return text, False
+            return text, None
         else:
             # Chế độ thông thường: kiểm tra toàn bộ text
-            return text, self._is_valid_timestamp(text)
+            return text, self._parse_timestamp(text)
     
-    def _is_valid_timestamp(self, text):
-        """Check if text is a valid timestamp"""
+    def _parse_timestamp(self, text):
+        """Return unix seconds if text is a valid timestamp, else None"""
         # Kiểm tra độ dài: 10-20 ký tự
-        if len(text) < 10 or len(text) > 20:
-            return False
+        n = len(text)
+        if n < 10 or n > 20:
+            return None
         
-        # Kiểm tra xem có phải là số float không
-        try:
+        # isascii() is O(1) in CPython; it also keeps non-Latin digits away from isdigit/int
+        if not text.isascii():
+            return None
+        
+        # Ký tự đầu phải là chữ số: loại nhanh tên biến, hash, URL...
+        if not '0' <= text[0] <= '9':
+            return None
+        
+        # Chỉ gồm chữ số: int() rẻ hơn float() và cho cùng giá trị
+        if text.isdigit():
+            timestamp_val = int(text)
+        else:
+            # Chỉ chữ số và tối đa một dấu chấm, loại nhanh trước khi gọi float()
+            if not text.replace('.', '', 1).isdigit():
+                return None
+            
+            # Đã kiểm tra ở trên nên float() không thể lỗi
             timestamp_val = float(text)
-            # Kiểm tra range hợp lý cho timestamp (1970-2050)
-            if timestamp_val > 1e12:  # milliseconds
-                timestamp_val = timestamp_val / 1000
-            return 946684800 <= timestamp_val <= 2524608000  # 2000-2050
-        except ValueError:
-            return False
+        
+        if timestamp_val > 1e12:  # milliseconds
+            timestamp_val = timestamp_val / 1000
+        
+        # Kiểm tra range hợp lý cho timestamp (2000-2050)
+        if _TS_MIN <= timestamp_val <= _TS_MAX:
+            return timestamp_val
+        return None
+    
+    def _build_popup(self):
+        """Create the frameless label used to show conversions near the cursor"""
+        popup = QLabel()
+        popup.setWindowFlags(Qt.ToolTip | Qt.FramelessWindowHint)
+        
+        # Tooltip look with the system default font
+        font = QApplication.font()
+        font.setPointSize(13)
+        font.setBold(True)
+        popup.setFont(font)
+        popup.setPalette(QToolTip.palette())
+        popup.setAutoFillBackground(True)
+        popup.setMargin(6)
+        return popup
     
-    def show_tooltip(self, timestamp_str):
+    def show_tooltip(self, timestamp_str, unix_time=None):
         """Show tooltip at cursor position"""
         try:
             # Convert timestamp
-            gmt_str, vn_str = self.convert_timestamp(timestamp_str)
+            gmt_str, vn_str = self.convert_timestamp(timestamp_str, unix_time)
             
             # Create tooltip text
             tooltip_text = f"🌍 GMT: {gmt_str}\n🇻🇳 VN:  {vn_str}"
             
-            # Hide any existing tooltip first
-            QToolTip.hideText()
+            # Re-copying the same timestamp keeps the text; only the position changes
+            if self._popup_text_changed(tooltip_text):
+                self._popup.setText(tooltip_text)
+                self._popup.adjustSize()
             
             # Show at cursor position with offset (above and to the right)
             cursor_pos = QCursor.pos()
-            tooltip_pos = QPoint(cursor_pos.x() + 40, cursor_pos.y() - 90)
-            
-            QToolTip.showText(tooltip_pos, tooltip_text)
-            
-            # Set consistent auto-hide timer (3 seconds)
-            if hasattr(self, 'tooltip_timer'):
-                self.tooltip_timer.stop()
+            self._popup.move(QPoint(cursor_pos.x() + 40, cursor_pos.y() - 90))
+            self._popup.show()
             
-            self.tooltip_timer = QTimer()
-            self.tooltip_timer.setSingleShot(True)
-            self.tooltip_timer.timeout.connect(QToolTip.hideText)
+            # (Re)arm the auto-hide timer
             self.tooltip_timer.start(self.tooltip_duration * 1000)  # Convert seconds to milliseconds
             
-            logger.info(f"✅ Tooltip shown for {self.tooltip_duration}s: {gmt_str} / {vn_str}")
+            logger.debug("✅ Tooltip shown for %ss: %s / %s", self.tooltip_duration, gmt_str, vn_str)
                 
         except Exception as e:
             logger.error(f"❌ Error showing tooltip: {e}")
             
-    def convert_timestamp(self, timestamp_str):
+    def _popup_text_changed(self, tooltip_text):
+        """Return True unless the popup is visible and already shows tooltip_text"""
+        return not (self._popup.isVisible() and self._popup.text() == tooltip_text)
+    
+    def convert_timestamp(self, timestamp_str, unix_time=None):
         """Convert timestamp to GMT and VN time"""
         try:
-            # Parse as float
-            unix_time = float(timestamp_str)
-            
-            # Kiểm tra xem có phần thập phân không và extract phần thập phân gốc
-            has_decimal = '.' in timestamp_str
-            original_decimal = ""
-            if has_decimal:
-                original_decimal = timestamp_str.split('.')[1].rstrip('0')  # Loại bỏ trailing zeros
-            
-            # Nếu số lớn hơn 1e12, coi như milliseconds
-            if unix_time > 1e12:
-                unix_time = unix_time / 1000
-            
-            # Convert to datetime
-            gmt_dt = datetime.utcfromtimestamp(unix_time)
-            vn_dt = datetime.fromtimestamp(unix_time)
-            
-            # Format output dựa trên settings
-            if self.show_decimal and has_decimal and original_decimal:
-                if self.show_full_decimal:
-                    # Hiển thị chính xác phần thập phân gốc
-                    gmt_str = gmt_dt.strftime('%Y-%m-%d %H:%M:%S') + f".{original_decimal}"
-                    vn_str = vn_dt.strftime('%Y-%m-%d %H:%M:%S') + f".{original_decimal}"
-                else:
-                    # Hiển thị theo số chữ số cấu hình từ phần thập phân gốc
-                    decimal_part = original_decimal[:self.decimal_places]
-                    if decimal_part:
-                        gmt_str = gmt_dt.strftime('%Y-%m-%d %H:%M:%S') + f".{decimal_part}"
-                        vn_str = vn_dt.strftime('%Y-%m-%d %H:%M:%S') + f".{decimal_part}"
-                    else:
-                        gmt_str = gmt_dt.strftime('%Y-%m-%d %H:%M:%S')
-                        vn_str = vn_dt.strftime('%Y-%m-%d %H:%M:%S')
-            else:
-                # Không hiển thị phần thập phân
-                gmt_str = gmt_dt.strftime('%Y-%m-%d %H:%M:%S')
-                vn_str = vn_dt.strftime('%Y-%m-%d %H:%M:%S')
-            
-            return gmt_str, vn_str
-            
+            unix_time, original_decimal = _decode_unix(timestamp_str, unix_time)
+            # Settings are part of the cache key, so changing them needs no invalidation
+            return _format_gmt_vn(unix_time, original_decimal,
+                                  self.show_decimal, self.show_full_decimal, self.decimal_places)
         except Exception as e:
             return f"Error: {str(e)}", f"Error: {str(e)}"
     
     def closeEvent(self, event):
         """Handle close event"""
-        if self.tray_icon and self.tray_icon.isVisible():
+        if self.tray_icon is not None and self.tray_icon.isVisible():
             self.hide()
             
             # Hide dock icon again on macOS when closing config window
-            if sys.platform == "darwin" and not self.first_run:
-                try:
-                    import AppKit
-                    AppKit.NSApp.setActivationPolicy_(AppKit.NSApplicationActivationPolicyProhibited)
-                except ImportError:
-                    pass
+            if _set_activation_policy is not None and not self.first_run:
+                _set_activation_policy(_POLICY_PROHIBITED)
             
             event.ignore()
         else:
@@ -1911,13 +2053,17 @@ THÔNG TIN:
     
     def quit_app(self):
         """Quit application"""
-        if hasattr(self, 'clipboard_timer'):
-            self.clipboard_timer.stop()
-        if hasattr(self, 'tooltip_timer'):
-            self.tooltip_timer.stop()
-        if hasattr(self, 'cmd_monitor'):
+        # Flush any pending debounced settings write
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._do_save_settings()
+        self.settings.sync()
+        self._copy_poll.stop()
+        self.tooltip_timer.stop()
+        self._popup.hide()
+        if self.cmd_monitor is not None:
             self.cmd_monitor.stop()
-        if hasattr(self, 'tray_icon'):
+        if self.tray_icon is not None:
             self.tray_icon.hide()
         QApplication.quit()
 
@@ -1937,12 +2083,8 @@ def main():
     viewer = SimpleTimestampViewer()
     
     # Hide dock icon on macOS only after first run
-    if sys.platform == "darwin" and not viewer.first_run:
-        try:
-            import AppKit
-            AppKit.NSApp.setActivationPolicy_(AppKit.NSApplicationActivationPolicyProhibited)
-        except ImportError:
-            pass
+    if _set_activation_policy is not None and not viewer.first_run:
+        _set_activation_policy(_POLICY_PROHIBITED)
     
     logger.info("🚀 QTKit (QuickTime Kit) started!")
     logger.info("📋 Copy any timestamp to see the magic!")